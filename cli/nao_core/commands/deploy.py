@@ -9,6 +9,8 @@ from cyclopts import Parameter
 
 from nao_core.tracking import track_command
 from nao_core.ui import UI
+from nao_core.walk import iter_files
+from nao_core.yaml_loader import load_yaml
 
 DEFAULT_EXCLUSIONS = {
     ".git",
@@ -46,14 +48,10 @@ def _should_exclude(rel_path: Path, exclusions: set[str]) -> bool:
 
 def _build_tarball(project_path: Path, exclusions: set[str]) -> bytes:
     buf = io.BytesIO()
+    files = (Path(rel) for rel in iter_files(project_path, exclusions))
     with tarfile.open(fileobj=buf, mode="w:gz") as tar:
-        for file_path in sorted(project_path.rglob("*")):
-            if not file_path.is_file():
-                continue
-            rel = file_path.relative_to(project_path)
-            if _should_exclude(rel, exclusions):
-                continue
-            tar.add(file_path, arcname=str(rel))
+        for rel in sorted(p for p in files if not _should_exclude(p, exclusions)):
+            tar.add(project_path / rel, arcname=str(rel))
     buf.seek(0)
     return buf.read()
 
@@ -65,7 +63,7 @@ def _read_project_name(project_path: Path) -> str | None:
         UI.error("No nao_config.yaml found in current directory")
         return None
     try:
-        data = yaml.safe_load(config_file.read_text())
+        data = load_yaml(config_file.read_text())
     except yaml.YAMLError as e:
         UI.error(f"Failed to load nao_config.yaml: Invalid YAML syntax: {e}")
         return None
@@ -11,6 +11,8 @@ from rich.console import Console
 
 console = Console()
 
+UNSAFE_FOLDER_CHARS_PATTERN = re.compile(r"[^A-Za-z0-9._-]+")
+
 
 @dataclass
 class DatabaseSyncState:
@@ -59,7 +61,7 @@ class DatabaseSyncState:
 
 def _sanitize_folder_part(value: str) -> str:
     """Sanitize arbitrary text for stable folder naming."""
-    sanitized = re.sub(r"[^A-Za-z0-9._-]+", "_", value.strip())
+    sanitized = UNSAFE_FOLDER_CHARS_PATTERN.sub("_", value.strip())
     return sanitized.strip("_") or "connection"
 
 
@@ -41,6 +41,11 @@ console = Console()
 
 TEMPLATE_PREFIX = "databases"
 
+COMPUTED_AT_PATTERN = re.compile(r"\*\*Computed at:\*\*\s*`([^`]+)`", re.IGNORECASE)
+# The default profiling template writes the timestamp in its header, so the
+# freshness check only needs to read the start of large profiling files
+PROFILING_HEADER_BYTES = 4096
+
 
 def _filter_templates_by_config(templates: list[str], db_config: AnyDatabaseConfig) -> list[str]:
     """Keep only templates whose stem matches the configured templates."""
@@ -129,8 +134,13 @@ def _should_refresh_profiling(
         return False
     if policy == ProfilingRefreshPolicy.INTERVAL:
         try:
-            content = output_file.read_text()
-            match = re.search(r"\*\*Computed at:\*\*\s*`([^`]+)`", content, re.IGNORECASE)
+            with output_file.open("rb") as f:
+                head = f.read(PROFILING_HEADER_BYTES)
+                # errors="ignore": the read may cut a multi-byte character in half
+                match = COMPUTED_AT_PATTERN.search(head.decode("utf-8", errors="ignore"))
+                if match is None and len(head) == PROFILING_HEADER_BYTES:
+                    # Custom templates may place the timestamp further down
+                    match = COMPUTED_AT_PATTERN.search((head + f.read()).decode("utf-8"))
             if match:
                 computed_at_str = match.group(1)
                 computed_at = datetime.fromisoformat(computed_at_str)
@@ -138,7 +148,8 @@ def _should_refresh_profiling(
                     computed_at = computed_at.replace(tzinfo=timezone.utc)
                 age = datetime.now(timezone.utc) - computed_at
                 return age > timedelta(days=profiling_config.interval_days)
-        except Exception:
+        except (OSError, ValueError):
+            # Unreadable file or malformed timestamp: recompute rather than trust it
             return True
 
     return True
@@ -295,7 +306,7 @@ def sync_database(
                         content = f"# {table}\n\nError generating content: {e}"
 
                     output_file = table_path / output_filename
-                    output_file.write_text(content)
+                    output_file.write_bytes(content.encode("utf-8"))
 
                 state.add_table(schema, table)
                 progress.update(table_task, advance=1)
@@ -324,7 +335,7 @@ def sync_database(
                     if sv.get("definition"):
                         content_parts.append("## Definition\n")
                         content_parts.append(f"```sql\n{sv['definition']}\n```\n")
-                    (sv_path / "definition.md").write_text("\n".join(content_parts))
+                    (sv_path / "definition.md").write_bytes("\n".join(content_parts).encode("utf-8"))
                     state.add_table(schema, sv["name"])
                 console.print(f"  [green]✓ {schema}[/green] [dim]— {len(semantic_views)} semantic views synced[/dim]")
 
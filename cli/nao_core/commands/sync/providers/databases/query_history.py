@@ -10,7 +10,7 @@ import sqlglot
 from sqlglot import exp
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TableUsageStats:
     """Per-table usage statistics computed from query history."""
 
@@ -19,14 +19,25 @@ class TableUsageStats:
     top_queries: list[tuple[str, int]] = field(default_factory=list)
 
 
-def extract_table_references(sql: str, dialect: str | None = None) -> list[str]:
-    """Extract table names referenced in FROM/JOIN clauses."""
-    tables: set[str] = set()
+def _parse(sql: str, dialect: str | None) -> list[exp.Expression | None] | None:
+    """Parse SQL with sqlglot, returning None when parsing fails outright."""
     try:
-        parsed = sqlglot.parse(sql, read=dialect, error_level=sqlglot.ErrorLevel.IGNORE)
+        return sqlglot.parse(sql, read=dialect, error_level=sqlglot.ErrorLevel.IGNORE)
     except Exception:
+        return None
+
+
+def extract_table_references(sql: str, dialect: str | None = None) -> list[str]:
+    """Extract table names referenced in FROM/JOIN clauses."""
+    return sorted(_table_references(sql, _parse(sql, dialect)))
+
+
+def _table_references(sql: str, parsed: list[exp.Expression | None] | None) -> set[str]:
+    """Unordered table references; compute_table_usage only tests membership, so skip the sort."""
+    if parsed is None:
         return _extract_table_references_fallback(sql)
 
+    tables: set[str] = set()
     for statement in parsed:
         if statement is None:
             continue
@@ -35,7 +46,7 @@ def extract_table_references(sql: str, dialect: str | None = None) -> list[str]:
             if name:
                 tables.add(name.lower())
 
-    return sorted(tables) if tables else _extract_table_references_fallback(sql)
+    return tables or _extract_table_references_fallback(sql)
 
 
 def _table_node_to_name(table_node: exp.Table) -> str | None:
@@ -58,7 +69,7 @@ _TABLE_RE = re.compile(
 )
 
 
-def _extract_table_references_fallback(sql: str) -> list[str]:
+def _extract_table_references_fallback(sql: str) -> set[str]:
     """Regex fallback when sqlglot parsing yields nothing useful."""
     tables: set[str] = set()
     for match in _TABLE_RE.finditer(sql):
@@ -67,7 +78,7 @@ def _extract_table_references_fallback(sql: str) -> list[str]:
             continue
         name = f"{schema_part}.{table_part}" if schema_part else table_part
         tables.add(name.lower())
-    return sorted(tables)
+    return tables
 
 
 _SQL_KEYWORDS = frozenset(
@@ -115,10 +126,12 @@ _SQL_KEYWORDS = frozenset(
 
 def extract_join_pairs(sql: str, dialect: str | None = None) -> list[tuple[str, str]]:
     """Extract (left_table, right_table) pairs from JOIN clauses."""
+    return _join_pairs(_parse(sql, dialect))
+
+
+def _join_pairs(parsed: list[exp.Expression | None] | None) -> list[tuple[str, str]]:
     pairs: list[tuple[str, str]] = []
-    try:
-        parsed = sqlglot.parse(sql, read=dialect, error_level=sqlglot.ErrorLevel.IGNORE)
-    except Exception:
+    if parsed is None:
         return pairs
 
     for statement in parsed:
@@ -150,12 +163,9 @@ def extract_join_pairs(sql: str, dialect: str | None = None) -> list[tuple[str,
     return pairs
 
 
-def _matches_table(ref: str, schema: str, table: str) -> bool:
-    """Check whether a table reference matches the given schema.table."""
-    ref_lower = ref.lower()
-    full = f"{schema}.{table}".lower()
-    table_lower = table.lower()
-    return ref_lower == full or ref_lower == table_lower or ref_lower.endswith(f".{table_lower}")
+def _matches_table(ref: str, full: str, table: str) -> bool:
+    """Check whether a lowercased table reference matches a lowercased schema.table (or bare table)."""
+    return ref == full or ref == table or ref.endswith(f".{table}")
 
 
 def compute_table_usage(
@@ -168,33 +178,52 @@ def compute_table_usage(
 
     Returns a dict keyed by "schema.table" with usage statistics.
     """
-    stats: dict[str, TableUsageStats] = {}
-    for schema, table in selected_tables:
-        stats[f"{schema}.{table}"] = TableUsageStats()
+    selected = list(dict.fromkeys(selected_tables))
+    # Parallel arrays: lowercased once here instead of per (query, table) pair below.
+    # Extracted references and join pairs are already lowercased.
+    keys = [f"{schema}.{table}" for schema, table in selected]
+    fulls = [key.lower() for key in keys]
+    names = [table.lower() for _, table in selected]
+
+    usage_counter: Counter[str] = Counter()
+    join_counter: dict[str, Counter[str]] = {k: Counter() for k in keys}
+    query_counter: dict[str, Counter[str]] = {k: Counter() for k in keys}
 
-    join_counter: dict[str, Counter[str]] = {k: Counter() for k in stats}
-    query_counter: dict[str, Counter[str]] = {k: Counter() for k in stats}
+    tables = list(zip(keys, fulls, names, strict=True))
 
     for sql in queries:
-        refs = extract_table_references(sql, dialect=dialect)
-        join_pairs = extract_join_pairs(sql, dialect=dialect)
+        # A table can only match if its name occurs in the query text, so skip
+        # the sqlglot parse for queries that mention none of the selected tables
+        lowered = sql.lower()
+        candidates = [t for t in tables if t[2] in lowered]
+        if not candidates:
+            continue
+
+        # Parse once; references and join pairs are both read off the same tree
+        parsed = _parse(sql, dialect)
+        refs = _table_references(sql, parsed)
+        join_pairs = _join_pairs(parsed)
+        # One stripped copy shared by every table the query touches
+        query_text = sql.strip()
 
-        for key, st in stats.items():
-            schema, table = key.split(".", 1)
-            if not any(_matches_table(r, schema, table) for r in refs):
+        for key, full, name in candidates:
+            if not any(_matches_table(r, full, name) for r in refs):
                 continue
 
-            st.usage_count += 1
-            query_counter[key][sql.strip()] += 1
+            usage_counter[key] += 1
+            query_counter[key][query_text] += 1
 
             for left, right in join_pairs:
-                if _matches_table(left, schema, table):
+                if _matches_table(left, full, name):
                     join_counter[key][right] += 1
-                elif _matches_table(right, schema, table):
+                elif _matches_table(right, full, name):
                     join_counter[key][left] += 1
 
-    for key, st in stats.items():
-        st.common_joins = join_counter[key].most_common(top_n)
-        st.top_queries = query_counter[key].most_common(top_n)
-
-    return stats
+    return {
+        key: TableUsageStats(
+            usage_count=usage_counter[key],
+            common_joins=join_counter[key].most_common(top_n),
+            top_queries=query_counter[key].most_common(top_n),
+        )
+        for key in keys
+    }
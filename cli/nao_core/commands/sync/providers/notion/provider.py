@@ -15,6 +15,9 @@ console = Console()
 # Notion page IDs are 32-character hex strings (UUID without dashes)
 NOTION_PAGE_ID_PATTERN = re.compile(r"[a-f0-9]{32}")
 
+# Characters dropped from page titles when building filenames
+UNSAFE_TITLE_CHARS_PATTERN = re.compile(r"[^\w\s-]")
+
 
 def cleanup_stale_pages(synced_files: set[str], output_path: Path, verbose: bool = False) -> int:
     """Remove markdown files that were not synced.
@@ -180,7 +183,7 @@ class NotionSyncProvider(SyncProvider):
                     title, markdown = get_page_as_markdown(page_url, api_key)
 
                     # Sanitize title for filename
-                    safe_title = re.sub(r"[^\w\s-]", "", title).strip().replace(" ", "-").lower()
+                    safe_title = UNSAFE_TITLE_CHARS_PATTERN.sub("", title).strip().replace(" ", "-").lower()
                     filename = f"{safe_title}.md"
 
                     with open(output_path / filename, "w") as f:
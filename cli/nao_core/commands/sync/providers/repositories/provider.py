@@ -1,8 +1,13 @@
 """Repository sync provider implementation."""
 
+import os
 import re
 import shutil
+import stat
 import subprocess
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from typing import Any
 
@@ -16,6 +21,12 @@ from ..base import SyncProvider, SyncResult
 
 console = Console()
 
+# Local path repos are copied in parallel with each other and with the git repos
+MAX_PARALLEL_REPOS = 8
+# File copies are I/O-bound (copy2 releases the GIL), so threads overlap them too.
+# This is a total across all local repos being synced at once.
+MAX_PARALLEL_COPIES = 8
+
 
 def clone_or_pull_repo(repo: RepoConfig, base_path: Path) -> bool:
     """Clone a repository if it doesn't exist, or pull latest changes if it does."""
@@ -73,8 +84,8 @@ def clone_or_pull_repo(repo: RepoConfig, base_path: Path) -> bool:
         return False
 
 
-def _glob_to_regex(pattern: str) -> re.Pattern[str]:
-    """Convert a path-aware glob pattern to a compiled regex.
+def _glob_to_regex_source(pattern: str) -> str:
+    """Convert a path-aware glob pattern to an (unanchored) regex string.
 
     Handles ** as zero-or-more directory levels. Segments are split on /
     so that * only matches within a single path component.
@@ -89,48 +100,154 @@ def _glob_to_regex(pattern: str) -> re.Pattern[str]:
             else:
                 regex_parts.append("(?:.+/)?")
         else:
-            part = ""
             for ch in seg:
                 if ch == "*":
-                    part += "[^/]*"
+                    regex_parts.append("[^/]*")
                 elif ch == "?":
-                    part += "[^/]"
+                    regex_parts.append("[^/]")
                 elif ch in r"\.[{()+^$|":
-                    part += "\\" + ch
+                    regex_parts.append("\\" + ch)
                 else:
-                    part += ch
-            regex_parts.append(part + ("/" if i < len(segments) - 1 else ""))
+                    regex_parts.append(ch)
+            if i < len(segments) - 1:
+                regex_parts.append("/")
+
+    return "".join(regex_parts)
 
-    return re.compile("^" + "".join(regex_parts) + "$")
 
+def _alternation(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile glob patterns into a single anchored regex alternation."""
+    if not patterns:
+        return None
+    return re.compile("^(?:" + "|".join(_glob_to_regex_source(p) for p in patterns) + ")$")
 
-def _matches_single_pattern(relative_path: str, pattern: str) -> bool:
-    """Match a single glob pattern against a relative file path.
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str] | None, re.Pattern[str] | None]:
+    """Compile a pattern list into one alternation for filename patterns and one for path patterns.
 
     Patterns without / are matched against the filename only (any depth).
     Patterns with / are matched against the full path with ** support.
+    A single regex per group scans each path once instead of once per pattern.
+    Cached since the same pattern lists are matched against every file.
     """
-    if "/" not in pattern:
-        filename = relative_path.rsplit("/", 1)[-1] if "/" in relative_path else relative_path
-        return _glob_to_regex(pattern).match(filename) is not None
-    return _glob_to_regex(pattern).match(relative_path) is not None
+    name_patterns = [p for p in patterns if "/" not in p]
+    path_patterns = [p for p in patterns if "/" in p]
+    return _alternation(name_patterns), _alternation(path_patterns)
+
+
+def _matches_any(relative_path: str, patterns: list[str]) -> bool:
+    """Check whether a relative file path matches any of the glob patterns."""
+    name_regex, path_regex = _compile_patterns(tuple(patterns))
+    if name_regex is not None:
+        filename = relative_path.rsplit("/", 1)[-1]
+        if name_regex.match(filename):
+            return True
+    return path_regex is not None and path_regex.match(relative_path) is not None
 
 
 def _matches_patterns(relative_path: str, include: list[str], exclude: list[str]) -> bool:
     """Check if a relative file path matches include/exclude glob patterns."""
-    if include:
-        if not any(_matches_single_pattern(relative_path, p) for p in include):
-            return False
+    if include and not _matches_any(relative_path, include):
+        return False
 
-    if exclude:
-        if any(_matches_single_pattern(relative_path, p) for p in exclude):
-            return False
+    if exclude and _matches_any(relative_path, exclude):
+        return False
 
     return True
 
 
-def sync_local_repo(repo: RepoConfig, base_path: Path) -> bool:
-    """Sync a local path repository by copying matching files."""
+def _is_up_to_date(source: Path, dest: Path) -> bool:
+    """Check whether dest is an unchanged copy of source (same size and mtime).
+
+    copy2 preserves the modification time, so a matching (size, mtime_ns) pair
+    means the file was copied on a previous sync and hasn't changed since.
+    Anything other than a regular file at dest (a directory left over from a
+    previous sync, a symlink) is never up to date.
+    """
+    try:
+        dest_stat = dest.lstat()
+    except (FileNotFoundError, NotADirectoryError):
+        # NotADirectoryError: a file now sits where a parent directory is needed
+        return False
+    if not stat.S_ISREG(dest_stat.st_mode):
+        return False
+    source_stat = source.stat()
+    return dest_stat.st_size == source_stat.st_size and dest_stat.st_mtime_ns == source_stat.st_mtime_ns
+
+
+def _walk_source(source_path: Path) -> Iterator[tuple[str, list[str], list[str]]]:
+    """Walk the source like copytree does, following directory symlinks.
+
+    Symlinks that point back to a directory already on the current path are
+    skipped so that a link cycle can't recurse forever.
+    """
+    chains = {str(source_path): (os.path.realpath(source_path),)}
+    for dirpath, dirnames, filenames in os.walk(source_path, followlinks=True):
+        chain = chains.pop(dirpath)
+        kept: list[str] = []
+        for name in dirnames:
+            child = os.path.join(dirpath, name)
+            real = os.path.realpath(child)
+            if real in chain:
+                continue
+            chains[child] = (*chain, real)
+            kept.append(name)
+        dirnames[:] = kept
+        yield dirpath, dirnames, filenames
+
+
+def _ensure_dir(repo_path: Path, rel_dir: str) -> None:
+    """Create repo_path/rel_dir, removing any file or symlink left where a directory is now needed."""
+    dest_dir = repo_path / rel_dir
+    if dest_dir.is_dir() and not dest_dir.is_symlink():
+        return
+    path = repo_path
+    for part in PurePosixPath(rel_dir).parts:
+        path = path / part
+        if path.is_symlink() or (path.exists() and not path.is_dir()):
+            path.unlink()
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+
+def _clear_dest(dest: Path) -> None:
+    """Remove whatever sits where a file is about to be copied.
+
+    Existing files are unlinked too rather than overwritten in place: copy2
+    copies permission bits, so a previous copy of a read-only source file
+    can't be opened for writing by a non-root user.
+    """
+    if dest.is_symlink() or dest.is_file():
+        dest.unlink()
+    elif dest.is_dir():
+        shutil.rmtree(dest)
+
+
+def _remove_stale_files(repo_path: Path, synced: set[str], synced_dirs: set[str] | None = None) -> None:
+    """Delete files from a previous sync that are no longer part of the source, then prune empty dirs.
+
+    Directories in synced_dirs are kept even when empty.
+    """
+    synced_dirs = synced_dirs or set()
+    # Bottom-up walk visits children before their parent directory, without sorting the whole tree
+    for dirpath, dirnames, filenames in os.walk(repo_path, topdown=False):
+        rel_dir = PurePosixPath(Path(dirpath).relative_to(repo_path))
+        links = [name for name in dirnames if os.path.islink(os.path.join(dirpath, name))]
+        for name in filenames + links:
+            if (rel_dir / name).as_posix() not in synced:
+                os.unlink(os.path.join(dirpath, name))
+        if dirpath != str(repo_path) and rel_dir.as_posix() not in synced_dirs and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+
+def sync_local_repo(repo: RepoConfig, base_path: Path, copy_workers: int = MAX_PARALLEL_COPIES) -> bool:
+    """Sync a local path repository by copying matching files.
+
+    Files whose size and mtime match the previous copy are skipped, so
+    re-syncing a large, mostly unchanged folder only copies what changed.
+    Like copytree, directory symlinks are followed and, when no include or
+    exclude filters are set, empty directories are kept.
+    """
     assert repo.local_path is not None
 
     source_path = Path(repo.local_path).resolve()
@@ -147,27 +264,50 @@ def sync_local_repo(repo: RepoConfig, base_path: Path) -> bool:
 
         console.print(f"  [dim]Syncing local path[/dim] {repo.name} [dim]from[/dim] {source_path}")
 
-        if repo_path.exists():
-            shutil.rmtree(repo_path)
+        if repo_path.is_symlink() or (repo_path.exists() and not repo_path.is_dir()):
+            repo_path.unlink()
+        repo_path.mkdir(parents=True, exist_ok=True)
 
         has_filters = bool(repo.include or repo.exclude)
-
-        if not has_filters:
-            shutil.copytree(source_path, repo_path, dirs_exist_ok=True)
-        else:
-            repo_path.mkdir(parents=True, exist_ok=True)
-            for file_path in source_path.rglob("*"):
+        synced: set[str] = set()
+        synced_dirs: set[str] = set()
+        to_copy: list[tuple[Path, Path]] = []
+        needed_dirs: set[str] = set()
+
+        for dirpath, _, filenames in _walk_source(source_path):
+            rel_dir = PurePosixPath(Path(dirpath).relative_to(source_path))
+            if not has_filters and rel_dir.parts:
+                synced_dirs.add(rel_dir.as_posix())
+
+            for name in filenames:
+                file_path = Path(dirpath, name)
+                # Skips broken symlinks and special files
                 if not file_path.is_file():
                     continue
 
-                relative = PurePosixPath(file_path.relative_to(source_path)).as_posix()
-                if not _matches_patterns(relative, repo.include, repo.exclude):
+                relative = (rel_dir / name).as_posix()
+                if has_filters and not _matches_patterns(relative, repo.include, repo.exclude):
                     continue
 
+                synced.add(relative)
                 dest = repo_path / relative
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(file_path, dest)
-
+                if not _is_up_to_date(file_path, dest):
+                    to_copy.append((file_path, dest))
+                    if rel_dir.parts:
+                        needed_dirs.add(rel_dir.as_posix())
+
+        # Create each destination directory once rather than once per file (parents first)
+        for rel_dir in sorted(needed_dirs | synced_dirs):
+            _ensure_dir(repo_path, rel_dir)
+
+        if to_copy:
+            for _, dest in to_copy:
+                _clear_dest(dest)
+            with ThreadPoolExecutor(max_workers=min(copy_workers, len(to_copy))) as executor:
+                # list() re-raises the first copy error, if any
+                list(executor.map(lambda pair: shutil.copy2(*pair), to_copy))
+
+        _remove_stale_files(repo_path, synced, synced_dirs)
         return True
 
     except Exception as e:
@@ -213,9 +353,25 @@ class RepositorySyncProvider(SyncProvider):
         console.print(f"\n[bold cyan]{self.emoji} Syncing {self.name}[/bold cyan]")
         console.print(f"[dim]Location:[/dim] {output_path.absolute()}\n")
 
-        for repo in items:
-            if sync_repo(repo, output_path):
-                success_count += 1
-                console.print(f"  [green]✓[/green] {repo.name}")
+        local_repos = [repo for repo in items if repo.is_local]
+        git_repos = [repo for repo in items if not repo.is_local]
+        parallel_local = min(MAX_PARALLEL_REPOS, len(local_repos))
+        # Split the copy budget so concurrent local syncs don't each start a full pool
+        copy_workers = max(1, MAX_PARALLEL_COPIES // max(1, parallel_local))
+
+        with ThreadPoolExecutor(max_workers=max(1, parallel_local)) as executor:
+            futures = {executor.submit(sync_local_repo, repo, output_path, copy_workers): repo for repo in local_repos}
+
+            # git and ssh may prompt on the terminal for credentials, so clones and
+            # pulls run one at a time while the local copies proceed in the background
+            for repo in git_repos:
+                if sync_repo(repo, output_path):
+                    success_count += 1
+                    console.print(f"  [green]✓[/green] {repo.name}")
+
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                    console.print(f"  [green]✓[/green] {futures[future].name}")
 
         return SyncResult(provider_name=self.name, items_synced=success_count)
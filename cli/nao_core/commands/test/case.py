@@ -1,9 +1,8 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
 from nao_core.ui import UI
+from nao_core.yaml_loader import load_yaml
 
 TESTS_FOLDER = "tests/"
 
@@ -21,7 +20,7 @@ class TestCase:
     def from_yaml(cls, file_path: Path) -> "TestCase":
         """Load a test case from a YAML file."""
         with open(file_path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         return cls(
             name=data.get("name", file_path.stem),
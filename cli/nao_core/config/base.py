@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from ibis import BaseBackend
 
 from nao_core.ui import UI, ask_confirm, ask_select
+from nao_core.yaml_loader import load_yaml
 
 from .databases import DATABASE_CONFIG_CLASSES, AnyDatabaseConfig, DatabaseTemplate, DatabaseType, parse_database_config
 from .error_handler import format_all_validation_errors
@@ -24,6 +25,8 @@ from .repos import RepoConfig
 from .skills import SkillsConfig
 from .slack import SlackConfig
 
+ENV_VAR_PATTERN = re.compile(r"\$?\{\{\s*env\(['\"]([^'\"]+)['\"]\)\s*\}\}")
+
 
 class NaoConfigError(Exception):
     """Raised when nao config loading fails."""
@@ -303,7 +306,7 @@ class NaoConfig(BaseModel):
         content = config_file.read_text()
         processed_content, env_vars = cls._process_env_vars(content, extra_env=extra_env)
         cls._missing_env_vars = {k: None for k, v in env_vars.items() if v is None}
-        data = yaml.safe_load(processed_content)
+        data = load_yaml(processed_content)
         return cls.model_validate(data)
 
     def get_connection(self, name: str) -> BaseBackend:
@@ -390,8 +393,10 @@ class NaoConfig(BaseModel):
             Tuple of (processed_content, env_var_status) where env_var_status maps
             env var names to their values (None if not set or empty)
         """
-        regex = re.compile(r"\$?\{\{\s*env\(['\"]([^'\"]+)['\"]\)\s*\}\}")
         env_vars: dict[str, str | None] = {}
+        # Most configs reference no env vars; skip the regex scan entirely
+        if "{{" not in content:
+            return content, env_vars
 
         def replacer(match: re.Match[str]) -> str:
             env_var = match.group(1)
@@ -402,7 +407,7 @@ class NaoConfig(BaseModel):
             env_vars[env_var] = value if value else None
             return value or ""
 
-        processed = regex.sub(replacer, content)
+        processed = ENV_VAR_PATTERN.sub(replacer, content)
         return processed, env_vars
 
 
@@ -137,35 +137,39 @@ class DatabaseConfig(BaseModel, ABC):
 
     def execute_sql(self, sql: str) -> pd.DataFrame:
         """Execute arbitrary SQL and return results as a DataFrame."""
-        import pandas as pd  # noqa: F811
-
         conn = self.connect()
         try:
-            cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
-
-            if hasattr(cursor, "fetchdf"):
-                return cursor.fetchdf()
-            if hasattr(cursor, "to_dataframe"):
-                return cursor.to_dataframe()
-            if hasattr(cursor, "to_pandas"):
-                return cursor.to_pandas()
-
-            # ClickHouse (clickhouse_connect) returns QueryResult with result_rows + column_names
-            if hasattr(cursor, "result_rows") and hasattr(cursor, "column_names"):
-                columns = list(cursor.column_names)
-                return pd.DataFrame(cursor.result_rows, columns=columns)  # type: ignore[arg-type]
-
-            if hasattr(cursor, "description") and cursor.description is not None and hasattr(cursor, "fetchall"):
-                columns = [desc[0] for desc in cursor.description]
-                return pd.DataFrame([tuple(row) for row in cursor.fetchall()], columns=columns)  # type: ignore[arg-type]
-
-            raise TypeError(
-                f"Unsupported raw_sql result type: {type(cursor).__name__}. "
-                "Expected cursor with fetchdf, to_dataframe, to_pandas, result_rows/column_names, or description/fetchall."
-            )
+            return self._run_sql(conn, sql)
         finally:
             conn.disconnect()
 
+    def _run_sql(self, conn: BaseBackend, sql: str) -> pd.DataFrame:
+        """Run SQL on an open connection and convert the result to a DataFrame."""
+        import pandas as pd  # noqa: F811
+
+        cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
+
+        if hasattr(cursor, "fetchdf"):
+            return cursor.fetchdf()
+        if hasattr(cursor, "to_dataframe"):
+            return cursor.to_dataframe()
+        if hasattr(cursor, "to_pandas"):
+            return cursor.to_pandas()
+
+        # ClickHouse (clickhouse_connect) returns QueryResult with result_rows + column_names
+        if hasattr(cursor, "result_rows") and hasattr(cursor, "column_names"):
+            columns = list(cursor.column_names)
+            return pd.DataFrame(cursor.result_rows, columns=columns)  # type: ignore[arg-type]
+
+        if hasattr(cursor, "description") and cursor.description is not None and hasattr(cursor, "fetchall"):
+            columns = [desc[0] for desc in cursor.description]
+            return pd.DataFrame([tuple(row) for row in cursor.fetchall()], columns=columns)  # type: ignore[arg-type]
+
+        raise TypeError(
+            f"Unsupported raw_sql result type: {type(cursor).__name__}. "
+            "Expected cursor with fetchdf, to_dataframe, to_pandas, result_rows/column_names, or description/fetchall."
+        )
+
     def matches_pattern(self, schema: str, table: str) -> bool:
         """Check if a schema.table matches the include/exclude patterns.
 
@@ -1,37 +1,77 @@
 from __future__ import annotations
 
+import logging
+import threading
 from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from nao_core.config.exceptions import InitError
 from nao_core.ui import ask_text
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ibis import BaseBackend
 
 from .base import DatabaseConfig
 from .context import DatabaseContext
 
+logger = logging.getLogger(__name__)
+
+# (table description, column name -> column description)
+TableDescriptions = tuple[str | None, dict[str, str]]
+
+_SCHEMA_DESCRIPTIONS_SQL = """
+    SELECT c.relname, d.objsubid, a.attname, d.description
+    FROM pg_catalog.pg_description d
+    JOIN pg_catalog.pg_class c ON c.oid = d.objoid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attnum = d.objsubid
+    WHERE n.nspname = %s
+"""
+
+_TABLE_DESCRIPTIONS_SQL = _SCHEMA_DESCRIPTIONS_SQL + "    AND c.relname = %s\n"
+
+_SYSTEM_SCHEMAS = frozenset({"pg_catalog", "information_schema"})
+
+# Same source (information_schema.schemata, i.e. schemas the user has privileges
+# on) and filter as get_schemas, so the reported count matches what sync sees
+_COUNT_USER_SCHEMAS_SQL = """
+    SELECT count(*)
+    FROM information_schema.schemata
+    WHERE schema_name !~ '^pg_' AND schema_name <> 'information_schema'
+"""
+
+# One idle connection per credential set, reused by execute_sql across calls and
+# config reloads (the server builds a fresh PostgresConfig for every request).
+# Ordered least recently used first; credentials can vary per request, so the
+# pool is bounded and the oldest idle connections are closed beyond the limit.
+_idle_connections: dict[tuple, BaseBackend] = {}
+_idle_connections_lock = threading.Lock()
+MAX_IDLE_CONNECTIONS = 4
+
+# psycopg.pq.TransactionStatus.IDLE (psycopg2's TRANSACTION_STATUS_IDLE is also 0)
+_TRANSACTION_STATUS_IDLE = 0
+
 
 class PostgresDatabaseContext(DatabaseContext):
     """Postgres context with pg_catalog description discovery."""
 
+    def __init__(
+        self,
+        conn: BaseBackend,
+        schema: str,
+        table_name: str,
+        descriptions: TableDescriptions | None = None,
+    ):
+        super().__init__(conn, schema, table_name)
+        self._descriptions_cache = descriptions
+
     def description(self) -> str | None:
         try:
-            query = f"""
-                SELECT d.description
-                FROM pg_catalog.pg_description d
-                JOIN pg_catalog.pg_class c ON c.oid = d.objoid
-                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
-                WHERE n.nspname = '{self._schema}' AND c.relname = '{self._table_name}' AND d.objsubid = 0
-            """
-            row = self._conn.raw_sql(query).fetchone()  # type: ignore[union-attr]
-            if row and row[0]:
-                return str(row[0]).strip() or None
+            return self._fetch_descriptions()[0]
         except Exception:
-            pass
-        return None
+            return None
 
     def columns(self) -> list[dict[str, Any]]:
         cols = super().columns()
@@ -45,16 +85,14 @@ class PostgresDatabaseContext(DatabaseContext):
         return cols
 
     def _fetch_column_descriptions(self) -> dict[str, str]:
-        query = f"""
-            SELECT a.attname, d.description
-            FROM pg_catalog.pg_description d
-            JOIN pg_catalog.pg_class c ON c.oid = d.objoid
-            JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attnum = d.objsubid
-            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
-            WHERE n.nspname = '{self._schema}' AND c.relname = '{self._table_name}' AND d.objsubid > 0
-        """
-        rows = self._conn.raw_sql(query).fetchall()  # type: ignore[union-attr]
-        return {row[0]: str(row[1]) for row in rows if row[1]}
+        return self._fetch_descriptions()[1]
+
+    def _fetch_descriptions(self) -> TableDescriptions:
+        """Return (table description, column descriptions), querying pg_description unless prefetched."""
+        if self._descriptions_cache is None:
+            rows = _fetch_catalog(self._conn, _TABLE_DESCRIPTIONS_SQL, (self._schema, self._table_name))
+            self._descriptions_cache = _group_descriptions(rows).get(self._table_name, (None, {}))
+        return self._descriptions_cache
 
     def _cast_float(self, expr: str) -> str:
         return f"CAST({expr} AS DOUBLE PRECISION)"
@@ -74,6 +112,9 @@ class PostgresConfig(DatabaseConfig):
     password: str = Field(description="Password")
     schema_name: str | None = Field(default=None, description="Default schema (optional, uses 'public' if not set)")
 
+    # Lazy cache: schema -> table_name -> descriptions (None if the batch query failed)
+    _schema_descriptions: dict[str, dict[str, TableDescriptions] | None] = PrivateAttr(default_factory=dict)
+
     @classmethod
     def promptConfig(cls) -> "PostgresConfig":
         """Interactively prompt the user for PostgreSQL configuration."""
@@ -130,17 +171,55 @@ class PostgresConfig(DatabaseConfig):
             return [self.schema_name]
         list_databases = getattr(conn, "list_databases", None)
         if list_databases:
-            schemas = list_databases()
             # Filter out system schemas
-            return [s for s in schemas if s not in ("pg_catalog", "information_schema") and not s.startswith("pg_")]
+            return [s for s in list_databases() if s not in _SYSTEM_SCHEMAS and not s.startswith("pg_")]
         return []
 
     def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> PostgresDatabaseContext:
-        return PostgresDatabaseContext(conn, schema, table_name)
+        return PostgresDatabaseContext(
+            conn,
+            schema,
+            table_name,
+            descriptions=self._get_table_descriptions(conn, schema, table_name),
+        )
+
+    def _get_table_descriptions(self, conn: BaseBackend, schema: str, table_name: str) -> TableDescriptions | None:
+        """Return cached descriptions for a table, fetching the whole schema in one query on first call.
+
+        Returns None when the schema batch could not be fetched, so the context
+        falls back to its own per-table query.
+        """
+        if schema not in self._schema_descriptions:
+            self._schema_descriptions[schema] = _fetch_schema_descriptions(conn, schema)
+        schema_descriptions = self._schema_descriptions[schema]
+        if schema_descriptions is None:
+            return None
+        return schema_descriptions.get(table_name, (None, {}))
 
     def get_query_history_sql(self, days: int) -> str | None:
         return "SELECT query AS query_text FROM pg_stat_statements WHERE calls > 0 LIMIT 10000"
 
+    def execute_sql(self, sql: str) -> pd.DataFrame:
+        """Execute SQL on a pooled connection instead of opening a new one per query.
+
+        The connection is checked out for the duration of the query, so
+        concurrent callers never share it; it is discarded if the query fails.
+        Session state (SET, temp tables, open transactions) is reset before the
+        connection goes back to the pool.
+        """
+        key = self._connection_key()
+        conn = _checkout_connection(key) or self.connect()
+        try:
+            df = self._run_sql(conn, sql)
+        except Exception:
+            _disconnect_quietly(conn)
+            raise
+        _checkin_connection(key, conn, self.schema_name)
+        return df
+
+    def _connection_key(self) -> tuple:
+        return (self.host, self.port, self.database, self.user, self.password, self.schema_name)
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to PostgreSQL."""
         conn = None
@@ -149,6 +228,8 @@ class PostgresConfig(DatabaseConfig):
             if self.schema_name:
                 tables = conn.list_tables()
                 return True, f"Connected successfully ({len(tables)} tables found)"
+            if (schema_count := _count_user_schemas(conn)) is not None:
+                return True, f"Connected successfully ({schema_count} schemas found)"
             if list_databases := getattr(conn, "list_databases", None):
                 schemas = list_databases()
                 return True, f"Connected successfully ({len(schemas)} schemas found)"
@@ -158,3 +239,121 @@ class PostgresConfig(DatabaseConfig):
         finally:
             if conn is not None:
                 conn.disconnect()
+
+
+def _fetch_catalog(conn: BaseBackend, query: str, params: tuple[Any, ...]) -> list[tuple]:
+    """Run a parameterized pg_catalog query on the underlying DBAPI connection.
+
+    Ibis' raw_sql does not forward bind parameters consistently across
+    psycopg2/psycopg versions, so go through the driver cursor directly.
+    Names are bound rather than interpolated, which keeps the SQL text
+    constant (plan-cacheable) and safe for arbitrary schema/table names.
+    """
+    con = conn.con  # type: ignore[attr-defined]
+    cursor = con.cursor()
+    try:
+        cursor.execute(query, params)
+        return cursor.fetchall()
+    except Exception:
+        con.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _group_descriptions(rows: list[tuple]) -> dict[str, TableDescriptions]:
+    """Group (relname, objsubid, attname, description) rows by table."""
+    result: dict[str, TableDescriptions] = {}
+    for relname, objsubid, attname, desc in rows:
+        _, col_descs = result.setdefault(relname, (None, {}))
+        if not desc:
+            continue
+        if objsubid == 0:
+            result[relname] = (str(desc).strip() or None, col_descs)
+        elif attname:
+            col_descs[attname] = str(desc)
+    return result
+
+
+def _fetch_schema_descriptions(conn: BaseBackend, schema: str) -> dict[str, TableDescriptions] | None:
+    """Fetch table and column descriptions for every table in a schema with a single query."""
+    try:
+        rows = _fetch_catalog(conn, _SCHEMA_DESCRIPTIONS_SQL, (schema,))
+    except Exception:
+        logger.debug("Failed to fetch descriptions for schema %s", schema)
+        return None
+    return _group_descriptions(rows)
+
+
+def _count_user_schemas(conn: BaseBackend) -> int | None:
+    """Count non-system schemas server-side instead of listing them all."""
+    try:
+        rows = _fetch_catalog(conn, _COUNT_USER_SCHEMAS_SQL, ())
+    except Exception:
+        logger.debug("Failed to count schemas, falling back to list_databases")
+        return None
+    return rows[0][0]
+
+
+def _checkout_connection(key: tuple) -> BaseBackend | None:
+    """Take the idle connection for key out of the pool if it is still usable."""
+    with _idle_connections_lock:
+        conn = _idle_connections.pop(key, None)
+    if conn is None:
+        return None
+    try:
+        # Server restarts and idle timeouts only surface on the next round-trip.
+        conn.raw_sql("SELECT 1").close()  # type: ignore[attr-defined]
+    except Exception:
+        logger.debug("Discarding stale pooled Postgres connection")
+        _disconnect_quietly(conn)
+        return None
+    return conn
+
+
+def _checkin_connection(key: tuple, conn: BaseBackend, schema: str | None) -> None:
+    """Reset a connection's session and return it to the pool.
+
+    The connection is closed instead if the reset fails or another one is
+    already idle for key; the least recently used idle connections are closed
+    once the pool exceeds MAX_IDLE_CONNECTIONS.
+    """
+    if not _reset_session(conn, schema):
+        _disconnect_quietly(conn)
+        return
+    to_close: list[BaseBackend] = []
+    with _idle_connections_lock:
+        if key in _idle_connections:
+            to_close.append(conn)
+        else:
+            _idle_connections[key] = conn
+            while len(_idle_connections) > MAX_IDLE_CONNECTIONS:
+                to_close.append(_idle_connections.pop(next(iter(_idle_connections))))
+    for idle in to_close:
+        _disconnect_quietly(idle)
+
+
+def _reset_session(conn: BaseBackend, schema: str | None) -> bool:
+    """Undo whatever session state a query left behind, then restore what ibis sets on connect."""
+    con = conn.con  # type: ignore[attr-defined]
+    try:
+        # Autocommit doesn't stop an explicit BEGIN from leaving a transaction open
+        if con.info.transaction_status != _TRANSACTION_STATUS_IDLE:
+            con.rollback()
+        with con.cursor() as cursor:
+            # Resets SET/SET ROLE, drops temp tables, prepared statements and advisory locks
+            cursor.execute("DISCARD ALL")
+            cursor.execute("SET TIMEZONE = UTC")
+            if schema:
+                cursor.execute("SELECT set_config('search_path', %s, false)", (schema,))
+    except Exception:
+        logger.debug("Failed to reset pooled Postgres connection")
+        return False
+    return True
+
+
+def _disconnect_quietly(conn: BaseBackend) -> None:
+    try:
+        conn.disconnect()
+    except Exception:
+        pass
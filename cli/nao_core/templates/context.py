@@ -23,6 +23,8 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
+from nao_core.yaml_loader import load_yaml
+
 if TYPE_CHECKING:
     from jinja2 import Environment
 
@@ -129,7 +131,7 @@ class FileProvider:
 
         def _parse(content: str) -> Any:
             try:
-                result = yaml.safe_load(content)
+                result = load_yaml(content)
             except yaml.YAMLError as e:
                 raise ValueError(f"Failed to parse YAML in '{path}': {e}") from e
             return result if result is not None else {}
@@ -175,7 +177,7 @@ class FileProvider:
             if len(parts) < 3:
                 return {"meta": {}, "content": content}
             try:
-                meta = yaml.safe_load(parts[1]) or {}
+                meta = load_yaml(parts[1]) or {}
             except yaml.YAMLError as e:
                 raise ValueError(f"Failed to parse frontmatter in '{path}': {e}") from e
             return {"meta": meta, "content": parts[2].strip()}
@@ -15,6 +15,8 @@ from typing import TYPE_CHECKING
 
 from jinja2 import Environment, FileSystemLoader, TemplateError
 
+from nao_core.walk import iter_files
+
 from .context import create_nao_context
 
 if TYPE_CHECKING:
@@ -69,15 +71,7 @@ def discover_templates(
             ".nao",
         }
 
-    templates: list[Path] = []
-
-    for path in project_path.rglob("*.j2"):
-        # Skip excluded directories
-        if any(excluded in path.parts for excluded in exclude_dirs):
-            continue
-
-        # Store relative path
-        templates.append(path.relative_to(project_path))
+    templates = [Path(rel) for rel in iter_files(project_path, exclude_dirs) if rel.endswith(".j2")]
 
     return sorted(templates)
 
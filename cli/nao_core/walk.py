@@ -0,0 +1,36 @@
+"""Directory walking that prunes excluded directories before descending.
+
+Built on os.scandir so file types come from the directory listing, and
+excluded directories (.git, node_modules, .venv, ...) are never entered,
+instead of being walked by Path.rglob and filtered out afterwards.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Collection, Iterator
+from pathlib import Path
+
+
+def iter_files(root: Path, exclude_dirs: Collection[str] = ()) -> Iterator[str]:
+    """Yield the paths of files under root, relative to it.
+
+    Directories whose name is in exclude_dirs are pruned. Like Path.rglob,
+    directory symlinks are not followed (symlinked files are yielded) and
+    directories that cannot be read are skipped.
+    """
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            entries = os.scandir(root / rel_dir)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                rel = os.path.join(rel_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude_dirs:
+                        stack.append(rel)
+                elif entry.is_file():
+                    yield rel
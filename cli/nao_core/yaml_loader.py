@@ -0,0 +1,22 @@
+"""YAML loading backed by libyaml when available.
+
+PyYAML ships a C loader (``CSafeLoader``) when it is built against libyaml,
+which parses several times faster than the pure-Python ``SafeLoader`` that
+``yaml.safe_load`` uses. Fall back to the pure-Python loader otherwise.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+def load_yaml(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse a YAML document with the same semantics as yaml.safe_load."""
+    return yaml.load(stream, Loader=SafeLoader)
@@ -96,6 +96,23 @@ class TestDatabaseContext:
 
         assert _should_refresh_profiling(profiling_file, config) is True
 
+    def test_should_refresh_when_timestamp_is_malformed(self, tmp_path):
+        profiling_file = tmp_path / "profiling.md"
+        profiling_file.write_text("**Computed at:** `not-a-date`\n")
+
+        config = ProfilingConfig(refresh_policy=ProfilingRefreshPolicy.INTERVAL, interval_days=1)
+
+        assert _should_refresh_profiling(profiling_file, config) is True
+
+    def test_finds_timestamp_past_the_header(self, tmp_path):
+        profiling_file = tmp_path / "profiling.md"
+        recent_time = datetime.now(timezone.utc) - timedelta(hours=1)
+        profiling_file.write_text("x" * 10_000 + f"\n**Computed at:** `{recent_time.isoformat()}`\n")
+
+        config = ProfilingConfig(refresh_policy=ProfilingRefreshPolicy.INTERVAL, interval_days=1)
+
+        assert _should_refresh_profiling(profiling_file, config) is False
+
     def test_should_refresh_when_file_missing(self, tmp_path):
         profiling_file = tmp_path / "profiling.md"
 
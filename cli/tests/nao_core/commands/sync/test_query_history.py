@@ -1,5 +1,9 @@
 """Unit tests for query history extraction and analysis."""
 
+from unittest.mock import patch
+
+import sqlglot
+
 from nao_core.commands.sync.providers.databases.query_history import (
     TableUsageStats,
     compute_table_usage,
@@ -125,6 +129,33 @@ class TestComputeTableUsage:
         top_sql, top_count = stats["schema1.users"].top_queries[0]
         assert top_count == 5
 
+    def test_parses_each_query_once(self):
+        queries = ["SELECT * FROM users JOIN orders ON users.id = orders.user_id", "SELECT * FROM users"]
+        selected = [("public", "users"), ("public", "orders")]
+
+        with patch("sqlglot.parse", wraps=sqlglot.parse) as parse:
+            stats = compute_table_usage(queries, selected)
+
+        assert parse.call_count == len(queries)
+        assert stats["public.users"].usage_count == 2
+        assert dict(stats["public.users"].common_joins) == {"orders": 1}
+
+    def test_skips_parsing_queries_that_mention_no_selected_table(self):
+        queries = ["SELECT * FROM events", "SELECT * FROM users"]
+
+        with patch("sqlglot.parse", wraps=sqlglot.parse) as parse:
+            stats = compute_table_usage(queries, [("public", "users")])
+
+        assert parse.call_count == 1
+        assert stats["public.users"].usage_count == 1
+
+    def test_matches_mixed_case_table_names(self):
+        queries = ["SELECT * FROM sales.orders", "SELECT * FROM ORDERS"]
+        selected = [("Sales", "Orders")]
+        stats = compute_table_usage(queries, selected)
+
+        assert stats["Sales.Orders"].usage_count == 2
+
     def test_returns_empty_stats_for_all_selected_tables(self):
         stats = compute_table_usage(
             [],
@@ -1,11 +1,16 @@
 """Unit tests for the repository sync provider."""
 
+import os
+import shutil
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from nao_core.commands.sync.providers.repositories.provider import (
+    MAX_PARALLEL_COPIES,
     RepositorySyncProvider,
     _matches_patterns,
     clone_or_pull_repo,
@@ -117,6 +122,42 @@ class TestRepositorySyncProvider:
 
         assert result.items_synced == 2
 
+    @patch("nao_core.commands.sync.providers.repositories.provider.console")
+    def test_git_repos_never_run_concurrently(self, mock_console, tmp_path: Path):
+        provider = RepositorySyncProvider()
+        repos = [RepoConfig(name=f"repo{i}", url=f"https://github.com/test/repo{i}") for i in range(4)]
+        running, peak = 0, 0
+        lock = threading.Lock()
+
+        def fake_sync(repo, base_path):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return True
+
+        with patch("nao_core.commands.sync.providers.repositories.provider.sync_repo", side_effect=fake_sync):
+            result = provider.sync(repos, tmp_path)
+
+        assert result.items_synced == 4
+        # Credential prompts from git/ssh would interleave on the terminal otherwise
+        assert peak == 1
+
+    @patch("nao_core.commands.sync.providers.repositories.provider.sync_local_repo", return_value=True)
+    @patch("nao_core.commands.sync.providers.repositories.provider.console")
+    def test_local_repos_share_the_copy_budget(self, mock_console, mock_local, tmp_path: Path):
+        provider = RepositorySyncProvider()
+        repos = [RepoConfig(name=f"local{i}", local_path=str(tmp_path)) for i in range(4)]
+
+        result = provider.sync(repos, tmp_path / "out")
+
+        assert result.items_synced == 4
+        copy_workers = {call.args[2] for call in mock_local.call_args_list}
+        assert copy_workers == {MAX_PARALLEL_COPIES // 4}
+
     def test_should_sync_returns_true_when_repos_exist(self):
         provider = RepositorySyncProvider()
         mock_config = MagicMock(spec=NaoConfig)
@@ -248,6 +289,13 @@ class TestMatchesPatterns:
         assert _matches_patterns("models/dim.sql", patterns, []) is True
         assert _matches_patterns("models/readme.md", patterns, []) is False
 
+    def test_mixed_filename_and_path_patterns(self):
+        exclude = ["*.pyc", "build/**", "*.log"]
+        assert _matches_patterns("src/cache/mod.pyc", [], exclude) is False
+        assert _matches_patterns("build/out/app.js", [], exclude) is False
+        assert _matches_patterns("logs/run.log", [], exclude) is False
+        assert _matches_patterns("src/build.py", [], exclude) is True
+
     def test_trailing_double_star_matches_all_files(self):
         assert _matches_patterns("__pycache__/foo.pyc", [], ["__pycache__/**"]) is False
         assert _matches_patterns("__pycache__/sub/bar.pyc", [], ["__pycache__/**"]) is False
@@ -330,6 +378,191 @@ class TestSyncLocalRepo:
         assert (output / "local-repo" / "new.txt").exists()
         assert not (output / "local-repo" / "old.txt").exists()
 
+    def test_skips_unchanged_files_on_resync(self, tmp_path: Path):
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "same.txt").write_text("unchanged")
+        (source / "edited.txt").write_text("v1")
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source))
+        assert sync_local_repo(repo, output) is True
+
+        (source / "edited.txt").write_text("version 2")
+        with patch(
+            "nao_core.commands.sync.providers.repositories.provider.shutil.copy2", wraps=shutil.copy2
+        ) as mock_copy:
+            assert sync_local_repo(repo, output) is True
+
+        copied = [Path(call.args[0]).name for call in mock_copy.call_args_list]
+        assert copied == ["edited.txt"]
+        assert (output / "local-repo" / "edited.txt").read_text() == "version 2"
+
+    def test_removes_files_deleted_from_source(self, tmp_path: Path):
+        source = tmp_path / "source"
+        (source / "nested").mkdir(parents=True)
+        (source / "keep.txt").write_text("keep")
+        (source / "nested" / "gone.txt").write_text("gone")
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source))
+        sync_local_repo(repo, output)
+
+        (source / "nested" / "gone.txt").unlink()
+        (source / "nested").rmdir()
+        sync_local_repo(repo, output)
+
+        assert (output / "local-repo" / "keep.txt").exists()
+        assert not (output / "local-repo" / "nested").exists()
+
+    def test_keeps_empty_directories_without_filters(self, tmp_path: Path):
+        source = tmp_path / "source"
+        (source / "empty").mkdir(parents=True)
+        (source / "file.txt").write_text("hello")
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source))
+        assert sync_local_repo(repo, output) is True
+        assert sync_local_repo(repo, output) is True
+
+        assert (output / "local-repo" / "empty").is_dir()
+
+    def test_follows_directory_symlinks(self, tmp_path: Path):
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "f.sql").write_text("SELECT 1")
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "linked").symlink_to(real, target_is_directory=True)
+        (source / "loop").symlink_to(source, target_is_directory=True)
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source))
+        assert sync_local_repo(repo, output) is True
+
+        copied = output / "local-repo" / "linked"
+        assert copied.is_dir() and not copied.is_symlink()
+        assert (copied / "f.sql").read_text() == "SELECT 1"
+        assert not (output / "local-repo" / "loop").exists()
+
+    def test_resyncs_changed_read_only_file(self, tmp_path: Path):
+        source = tmp_path / "source"
+        source.mkdir()
+        src_file = source / "locked.sql"
+        src_file.write_text("SELECT 1")
+        src_file.chmod(0o444)
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source))
+        assert sync_local_repo(repo, output) is True
+
+        src_file.chmod(0o644)
+        src_file.write_text("SELECT 22")
+        src_file.chmod(0o444)
+
+        # copy2 must never write through an existing (read-only) copy; running as
+        # root would mask the PermissionError, so check the destination is gone
+        real_copy2 = shutil.copy2
+
+        def copy2_into_fresh_path(src, dst):
+            assert not os.path.lexists(dst)
+            return real_copy2(src, dst)
+
+        with patch("shutil.copy2", side_effect=copy2_into_fresh_path):
+            assert sync_local_repo(repo, output) is True
+
+        assert (output / "local-repo" / "locked.sql").read_text() == "SELECT 22"
+
+    def test_filtered_sync_follows_directory_symlinks(self, tmp_path: Path):
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "f.sql").write_text("SELECT 1")
+        (real / "notes.md").write_text("docs")
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "linked").symlink_to(real, target_is_directory=True)
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source), include=["**/*.sql"])
+        assert sync_local_repo(repo, output) is True
+
+        assert (output / "local-repo" / "linked" / "f.sql").read_text() == "SELECT 1"
+        assert not (output / "local-repo" / "linked" / "notes.md").exists()
+
+    def test_directory_replaced_by_file(self, tmp_path: Path):
+        source = tmp_path / "source"
+        (source / "a").mkdir(parents=True)
+        (source / "a" / "inner.txt").write_text("inner")
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source))
+        assert sync_local_repo(repo, output) is True
+
+        shutil.rmtree(source / "a")
+        (source / "a").write_text("now a file")
+        assert sync_local_repo(repo, output) is True
+
+        assert (output / "local-repo" / "a").read_text() == "now a file"
+
+    def test_file_replaced_by_directory(self, tmp_path: Path):
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "a").write_text("a file")
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source))
+        assert sync_local_repo(repo, output) is True
+
+        (source / "a").unlink()
+        (source / "a").mkdir()
+        (source / "a" / "inner.txt").write_text("inner")
+        assert sync_local_repo(repo, output) is True
+
+        assert (output / "local-repo" / "a" / "inner.txt").read_text() == "inner"
+
+    def test_copies_many_files_across_directories(self, tmp_path: Path):
+        source = tmp_path / "source"
+        for i in range(20):
+            (source / f"dir{i % 4}").mkdir(parents=True, exist_ok=True)
+            (source / f"dir{i % 4}" / f"file{i}.txt").write_text(str(i))
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source))
+        assert sync_local_repo(repo, output) is True
+
+        for i in range(20):
+            assert (output / "local-repo" / f"dir{i % 4}" / f"file{i}.txt").read_text() == str(i)
+
+    def test_returns_false_when_copy_fails(self, tmp_path: Path):
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "file.txt").write_text("hello")
+
+        output = tmp_path / "output"
+        output.mkdir()
+
+        repo = RepoConfig(name="local-repo", local_path=str(source))
+        with patch("shutil.copy2", side_effect=OSError("disk full")):
+            assert sync_local_repo(repo, output) is False
+
     def test_returns_false_for_missing_path(self, tmp_path: Path):
         output = tmp_path / "output"
         output.mkdir()
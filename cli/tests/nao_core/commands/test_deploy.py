@@ -0,0 +1,64 @@
+"""Unit tests for the deploy command's project tarball."""
+
+import io
+import os
+import tarfile
+from pathlib import Path
+from unittest.mock import patch
+
+from nao_core.commands.deploy import DEFAULT_EXCLUSIONS, _build_tarball
+
+
+def _members(tarball: bytes) -> dict[str, tarfile.TarInfo]:
+    with tarfile.open(fileobj=io.BytesIO(tarball), mode="r:gz") as tar:
+        return {member.name: member for member in tar.getmembers()}
+
+
+class TestBuildTarball:
+    """Tests for _build_tarball."""
+
+    def test_skips_excluded_directories_and_patterns(self, tmp_path: Path):
+        (tmp_path / "models").mkdir()
+        (tmp_path / "models" / "orders.sql").write_text("SELECT 1")
+        (tmp_path / "models" / "cache.pyc").write_bytes(b"\x00")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "HEAD").write_text("ref")
+        (tmp_path / "docs" / "node_modules").mkdir(parents=True)
+        (tmp_path / "docs" / "node_modules" / "pkg.js").write_text("")
+        (tmp_path / "docs" / "guide.md").write_text("# Guide")
+        (tmp_path / "nao_config.yaml").write_text("project_name: demo")
+
+        members = _members(_build_tarball(tmp_path, DEFAULT_EXCLUSIONS))
+
+        assert sorted(members) == ["docs/guide.md", "models/orders.sql", "nao_config.yaml"]
+
+    def test_symlinked_files_are_kept_and_symlinked_directories_skipped(self, tmp_path: Path):
+        project = tmp_path / "project"
+        (project / "models").mkdir(parents=True)
+        (project / "models" / "orders.sql").write_text("SELECT 1")
+        (project / "alias.sql").symlink_to(Path("models") / "orders.sql")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.sql").write_text("SELECT 2")
+        (project / "linked").symlink_to(outside, target_is_directory=True)
+
+        members = _members(_build_tarball(project, DEFAULT_EXCLUSIONS))
+
+        assert sorted(members) == ["alias.sql", "models/orders.sql"]
+        assert members["alias.sql"].issym()
+
+    def test_skips_unreadable_directories(self, tmp_path: Path):
+        (tmp_path / "pgdata").mkdir()
+        (tmp_path / "pgdata" / "base").write_text("")
+        (tmp_path / "nao_config.yaml").write_text("project_name: demo")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if Path(path).name == "pgdata":
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        with patch("os.scandir", side_effect=scandir):
+            members = _members(_build_tarball(tmp_path, DEFAULT_EXCLUSIONS))
+
+        assert sorted(members) == ["nao_config.yaml"]
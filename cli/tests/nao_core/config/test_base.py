@@ -55,6 +55,14 @@ def test_mixed_dollar_and_no_dollar_syntax():
         assert result == "a: value1, b: value2"
 
 
+def test_content_without_env_vars_is_returned_unchanged():
+    """Content without any {{ }} placeholder skips substitution."""
+    content = "project_name: demo\ndatabases: []\n"
+    result, env_vars = NaoConfig._process_env_vars(content)
+    assert result is content
+    assert env_vars == {}
+
+
 @patch("nao_core.config.base.ask_confirm")
 @patch("nao_core.config.llm.LLMConfig.promptConfig")
 def test_prompt_llm_skips_annotation_model_when_ai_summary_is_disabled(mock_prompt_config, mock_confirm):
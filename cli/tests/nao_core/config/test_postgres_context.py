@@ -0,0 +1,285 @@
+"""Unit tests for PostgresDatabaseContext pg_catalog description lookups and connection reuse."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nao_core.config.databases import postgres
+from nao_core.config.databases.postgres import PostgresConfig, PostgresDatabaseContext
+
+
+def _make_context(schema: str = "public", table: str = "orders") -> tuple[PostgresDatabaseContext, MagicMock]:
+    """Return a context whose DBAPI cursor is a mock."""
+    mock_conn = MagicMock()
+    mock_schema = MagicMock()
+    schema_items = [
+        ("id", MagicMock(__str__=lambda s: "int64", nullable=False)),
+        ("status", MagicMock(__str__=lambda s: "string", nullable=True)),
+    ]
+    mock_schema.items.return_value = schema_items
+    mock_conn.table.return_value.schema.return_value = mock_schema
+    return PostgresDatabaseContext(mock_conn, schema, table), mock_conn.con.cursor.return_value
+
+
+class TestDescription:
+    def test_returns_table_comment(self):
+        ctx, cursor = _make_context()
+        cursor.fetchall.return_value = [("orders", 0, None, "  All customer orders  ")]
+
+        assert ctx.description() == "All customer orders"
+
+    def test_binds_schema_and_table_as_parameters(self):
+        ctx, cursor = _make_context(schema="o'brien", table="orders")
+        cursor.fetchall.return_value = []
+
+        ctx.description()
+
+        query, params = cursor.execute.call_args.args
+        assert params == ("o'brien", "orders")
+        assert "o'brien" not in query
+
+    def test_returns_none_and_rolls_back_on_error(self):
+        ctx, cursor = _make_context()
+        cursor.execute.side_effect = RuntimeError("permission denied")
+
+        assert ctx.description() is None
+        ctx._conn.con.rollback.assert_called_once()
+        cursor.close.assert_called_once()
+
+
+class TestColumns:
+    def test_merges_column_comments(self):
+        ctx, cursor = _make_context()
+        cursor.fetchall.return_value = [("orders", 0, None, "Orders"), ("orders", 2, "status", "Order lifecycle state")]
+
+        cols = {col["name"]: col for col in ctx.columns()}
+
+        assert cols["status"]["description"] == "Order lifecycle state"
+        assert cols["id"]["description"] is None
+
+    def test_shares_one_query_with_description(self):
+        ctx, cursor = _make_context()
+        cursor.fetchall.return_value = [("orders", 0, None, "Orders"), ("orders", 2, "status", "Order lifecycle state")]
+
+        ctx.columns()
+        assert ctx.description() == "Orders"
+
+        cursor.execute.assert_called_once()
+
+
+class TestSchemaPrefetch:
+    def _make_config(self) -> PostgresConfig:
+        return PostgresConfig(name="pg", host="localhost", database="db", user="u", password="p")
+
+    def test_one_query_serves_every_table_in_schema(self):
+        config = self._make_config()
+        mock_conn = MagicMock()
+        cursor = mock_conn.con.cursor.return_value
+        cursor.fetchall.return_value = [
+            ("orders", 0, None, "Orders"),
+            ("orders", 2, "status", "Order lifecycle state"),
+            ("customers", 0, None, "Customers"),
+        ]
+
+        orders = config.create_context(mock_conn, "public", "orders")
+        customers = config.create_context(mock_conn, "public", "customers")
+        uncommented = config.create_context(mock_conn, "public", "events")
+
+        assert orders.description() == "Orders"
+        assert orders._fetch_column_descriptions() == {"status": "Order lifecycle state"}
+        assert customers.description() == "Customers"
+        assert uncommented.description() is None
+        cursor.execute.assert_called_once()
+        assert cursor.execute.call_args.args[1] == ("public",)
+
+    def test_falls_back_to_per_table_query_when_prefetch_fails(self):
+        config = self._make_config()
+        mock_conn = MagicMock()
+        cursor = mock_conn.con.cursor.return_value
+        cursor.execute.side_effect = [RuntimeError("timeout"), None]
+        cursor.fetchall.return_value = [("orders", 0, None, "Orders")]
+
+        ctx = config.create_context(mock_conn, "public", "orders")
+
+        assert ctx.description() == "Orders"
+        assert cursor.execute.call_args.args[1] == ("public", "orders")
+
+
+class _FakeSession:
+    """Stand-in for a psycopg connection that tracks session settings and transaction state."""
+
+    def __init__(self):
+        self.settings: dict[str, str] = {}
+        self.info = SimpleNamespace(transaction_status=0)
+
+    def cursor(self) -> "_FakeCursor":
+        return _FakeCursor(self)
+
+    def rollback(self) -> None:
+        self.info.transaction_status = 0
+
+
+class _FakeCursor:
+    def __init__(self, session: _FakeSession):
+        self._session = session
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def execute(self, sql: str, params: tuple | None = None) -> None:
+        session = self._session
+        if sql == "BEGIN":
+            session.info.transaction_status = 2  # INTRANS
+        elif sql == "DISCARD ALL":
+            if session.info.transaction_status != 0:
+                raise RuntimeError("DISCARD ALL cannot run inside a transaction block")
+            session.settings.clear()
+        elif sql.startswith("SELECT set_config('search_path'"):
+            assert params is not None
+            session.settings["search_path"] = params[0]
+        elif sql.startswith("SET "):
+            name, value = sql[4:].split("=")
+            session.settings[name.strip().lower()] = value.strip()
+
+
+def _run_on_session(conn: MagicMock, sql: str) -> str:
+    with conn.con.cursor() as cursor:
+        cursor.execute(sql)
+    return "df"
+
+
+class TestExecuteSqlPool:
+    @pytest.fixture(autouse=True)
+    def _empty_pool(self):
+        postgres._idle_connections.clear()
+        yield
+        postgres._idle_connections.clear()
+
+    def _make_config(self, **kwargs) -> PostgresConfig:
+        return PostgresConfig(name="pg", host="localhost", database="db", user="u", password="p", **kwargs)
+
+    def _make_conn(self) -> MagicMock:
+        conn = MagicMock()
+        conn.con = _FakeSession()
+        return conn
+
+    def test_reuses_connection_across_configs(self):
+        conn = self._make_conn()
+        with (
+            patch.object(PostgresConfig, "connect", return_value=conn) as connect,
+            patch.object(PostgresConfig, "_run_sql", return_value="df"),
+        ):
+            assert self._make_config().execute_sql("SELECT 1") == "df"
+            assert self._make_config().execute_sql("SELECT 2") == "df"
+
+        connect.assert_called_once()
+        conn.disconnect.assert_not_called()
+
+    def test_set_state_does_not_survive_checkout(self):
+        conn = self._make_conn()
+        config = self._make_config(schema_name="analytics")
+        with (
+            patch.object(PostgresConfig, "connect", return_value=conn),
+            patch.object(PostgresConfig, "_run_sql", side_effect=_run_on_session),
+        ):
+            config.execute_sql("SET search_path = evil")
+            config.execute_sql("SET statement_timeout = 1")
+
+        assert conn.con.settings == {"timezone": "UTC", "search_path": "analytics"}
+        assert postgres._idle_connections[config._connection_key()] is conn
+
+    def test_rolls_back_open_transaction_before_checkin(self):
+        conn = self._make_conn()
+        config = self._make_config()
+        with (
+            patch.object(PostgresConfig, "connect", return_value=conn),
+            patch.object(PostgresConfig, "_run_sql", side_effect=_run_on_session),
+        ):
+            config.execute_sql("BEGIN")
+
+        assert conn.con.info.transaction_status == 0
+        assert postgres._idle_connections[config._connection_key()] is conn
+
+    def test_closes_connection_when_reset_fails(self):
+        conn = self._make_conn()
+        conn.con.rollback = MagicMock()  # leaves the transaction open, so DISCARD ALL fails
+        with (
+            patch.object(PostgresConfig, "connect", return_value=conn),
+            patch.object(PostgresConfig, "_run_sql", side_effect=_run_on_session),
+        ):
+            self._make_config().execute_sql("BEGIN")
+
+        conn.disconnect.assert_called_once()
+        assert postgres._idle_connections == {}
+
+    def test_evicts_least_recently_used_credentials(self):
+        conns = [self._make_conn() for _ in range(3)]
+        configs = [self._make_config(schema_name=f"s{i}") for i in range(3)]
+        with (
+            patch.object(postgres, "MAX_IDLE_CONNECTIONS", 2),
+            patch.object(PostgresConfig, "connect", side_effect=conns),
+            patch.object(PostgresConfig, "_run_sql", return_value="df"),
+        ):
+            for config in configs:
+                config.execute_sql("SELECT 1")
+
+        conns[0].disconnect.assert_called_once()
+        assert list(postgres._idle_connections) == [configs[1]._connection_key(), configs[2]._connection_key()]
+
+    def test_discards_connection_when_query_fails(self):
+        conn = self._make_conn()
+        with (
+            patch.object(PostgresConfig, "connect", return_value=conn),
+            patch.object(PostgresConfig, "_run_sql", side_effect=RuntimeError("syntax error")),
+        ):
+            with pytest.raises(RuntimeError):
+                self._make_config().execute_sql("SELEC 1")
+
+        conn.disconnect.assert_called_once()
+        assert postgres._idle_connections == {}
+
+    def test_replaces_stale_connection(self):
+        stale, fresh = self._make_conn(), self._make_conn()
+        stale.raw_sql.side_effect = RuntimeError("server closed the connection")
+        config = self._make_config()
+        postgres._idle_connections[config._connection_key()] = stale
+
+        with (
+            patch.object(PostgresConfig, "connect", return_value=fresh) as connect,
+            patch.object(PostgresConfig, "_run_sql", return_value="df"),
+        ):
+            config.execute_sql("SELECT 1")
+
+        connect.assert_called_once()
+        stale.disconnect.assert_called_once()
+        assert postgres._idle_connections[config._connection_key()] is fresh
+
+
+class TestCheckConnection:
+    def test_counts_schemas_server_side(self):
+        config = PostgresConfig(name="pg", host="localhost", database="db", user="u", password="p")
+        mock_conn = MagicMock()
+        mock_conn.con.cursor.return_value.fetchall.return_value = [(3,)]
+
+        with patch.object(PostgresConfig, "connect", return_value=mock_conn):
+            success, message = config.check_connection()
+
+        assert success is True
+        assert "3 schemas found" in message
+        mock_conn.list_databases.assert_not_called()
+        # Same source as list_databases(), so the count matches get_schemas()
+        query = mock_conn.con.cursor.return_value.execute.call_args.args[0]
+        assert "information_schema.schemata" in query
+
+
+class TestGetSchemas:
+    def test_filters_system_schemas(self):
+        config = PostgresConfig(name="pg", host="localhost", database="db", user="u", password="p")
+        mock_conn = MagicMock()
+        mock_conn.list_databases.return_value = ["public", "pg_catalog", "pg_toast", "information_schema", "sales"]
+
+        assert config.get_schemas(mock_conn) == ["public", "sales"]
@@ -1,10 +1,11 @@
 """Unit tests for the user template renderer (render.py)."""
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from nao_core.templates.render import render_template
+from nao_core.templates.render import discover_templates, render_template
 
 
 def _make_mock_nao(attrs: dict) -> MagicMock:
@@ -61,3 +62,38 @@ class TestRenderTemplateToJsonFilter:
         assert "\\u" not in rendered
         parsed = json.loads(rendered)
         assert parsed == rows
+
+
+class TestDiscoverTemplates:
+    def test_finds_nested_templates_and_skips_excluded_dirs(self, tmp_path: Path):
+        (tmp_path / "docs" / "sub").mkdir(parents=True)
+        (tmp_path / "docs" / "report.md.j2").write_text("")
+        (tmp_path / "docs" / "sub" / "table.md.j2").write_text("")
+        (tmp_path / "docs" / "notes.md").write_text("")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "x.j2").write_text("")
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "override.j2").write_text("")
+
+        assert discover_templates(tmp_path) == [Path("docs/report.md.j2"), Path("docs/sub/table.md.j2")]
+
+    def test_custom_exclude_dirs(self, tmp_path: Path):
+        (tmp_path / "skip").mkdir()
+        (tmp_path / "skip" / "a.j2").write_text("")
+        (tmp_path / "b.j2").write_text("")
+
+        assert discover_templates(tmp_path, exclude_dirs={"skip"}) == [Path("b.j2")]
+
+    def test_skips_unreadable_dirs(self, tmp_path: Path):
+        (tmp_path / "pgdata").mkdir()
+        (tmp_path / "pgdata" / "hidden.j2").write_text("")
+        (tmp_path / "report.md.j2").write_text("")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if Path(path).name == "pgdata":
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        with patch("os.scandir", side_effect=scandir):
+            assert discover_templates(tmp_path) == [Path("report.md.j2")]
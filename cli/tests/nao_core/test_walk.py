@@ -0,0 +1,46 @@
+"""Unit tests for the directory walking helpers."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from nao_core.walk import iter_files
+
+
+class TestIterFiles:
+    """Tests for iter_files."""
+
+    def test_yields_relative_file_paths(self, tmp_path: Path):
+        """Files at every depth are yielded relative to the root; directories are not."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.txt").write_text("")
+        (tmp_path / "a" / "b" / "deep.txt").write_text("")
+
+        assert sorted(iter_files(tmp_path)) == ["a/b/deep.txt", "top.txt"]
+
+    def test_prunes_excluded_directories_at_any_depth(self, tmp_path: Path):
+        """Excluded directory names are not descended into."""
+        (tmp_path / "src" / "node_modules").mkdir(parents=True)
+        (tmp_path / "src" / "node_modules" / "pkg.js").write_text("")
+        (tmp_path / "src" / "main.py").write_text("")
+
+        with patch("os.scandir", wraps=os.scandir) as scandir:
+            files = sorted(iter_files(tmp_path, {"node_modules"}))
+
+        assert files == ["src/main.py"]
+        assert all(Path(call.args[0]).name != "node_modules" for call in scandir.call_args_list)
+
+    def test_skips_unreadable_directories(self, tmp_path: Path):
+        """A directory that cannot be listed is skipped, like Path.rglob does."""
+        (tmp_path / "locked").mkdir()
+        (tmp_path / "locked" / "hidden.txt").write_text("")
+        (tmp_path / "visible.txt").write_text("")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if Path(path).name == "locked":
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        with patch("os.scandir", side_effect=scandir):
+            assert list(iter_files(tmp_path)) == ["visible.txt"]
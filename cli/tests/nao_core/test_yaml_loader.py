@@ -0,0 +1,32 @@
+"""Unit tests for the YAML loader module."""
+
+import pytest
+import yaml
+
+from nao_core.yaml_loader import SafeLoader, load_yaml
+
+
+class TestLoadYaml:
+    """Tests for load_yaml."""
+
+    def test_matches_safe_load(self):
+        """load_yaml returns the same data as yaml.safe_load."""
+        content = "models:\n  - name: orders\n    description: All orders\n    tags: [a, b]\n"
+
+        assert load_yaml(content) == yaml.safe_load(content)
+
+    def test_empty_document_returns_none(self):
+        """An empty document parses to None, like yaml.safe_load."""
+        assert load_yaml("") is None
+
+    def test_rejects_python_tags(self):
+        """Arbitrary Python object tags are refused, as with the safe loader."""
+        with pytest.raises(yaml.YAMLError):
+            load_yaml("!!python/object/apply:os.system ['true']")
+
+    def test_prefers_libyaml_loader(self):
+        """The C loader is used whenever PyYAML was built with libyaml."""
+        if getattr(yaml, "__with_libyaml__", False):
+            assert SafeLoader is yaml.CSafeLoader
+        else:
+            assert SafeLoader is yaml.SafeLoader